@@ -4,96 +4,158 @@ Add a new video to the match analysis system.
 Usage: uv run python add_video.py <youtube-url>
 
 This script:
-1. Downloads the video using yt-dlp
-2. Extracts metadata from YouTube
-3. Uploads the video to Gemini Files API
-4. Creates the match directory structure with metadata.json
+1. Extracts metadata from YouTube
+2. Downloads the video using yt-dlp
+3. Optionally downscales the video with ffmpeg (--preprocess)
+4. Uploads the video to Gemini Files API
+5. Creates the match directory structure with metadata.json
 """
 
 import argparse
-import json
+import asyncio
 import re
-import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from google import genai
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
+
+from gemini_http import HTTP_OPTIONS
+import match_index
 
 load_dotenv()
 
 MATCHES_DIR = Path("matches")
 
+YDL_OPTIONS = {
+    "format": "bestvideo[ext=webm]+bestaudio[ext=webm]/best[ext=webm]/bestvideo+bestaudio/best",
+    "merge_output_format": "webm",
+    "quiet": True,
+    "no_warnings": True,
+}
+
+# Relative size difference below which an existing download is reused
+SIZE_TOLERANCE = 0.02
+
+# --preprocess output: Gemini samples video at about 1 fps and rescales
+# frames anyway, so a 720p / 5 fps copy loses little and uploads much faster
+PREPROCESS_HEIGHT = 720
+PREPROCESS_FPS = 5
+
+# Tried in order, so a watch/short URL wins over an embed URL or bare ID
+VIDEO_ID_PATTERNS = [
+    re.compile(r'(?:v=|/v/|youtu\.be/)([a-zA-Z0-9_-]{11})'),
+    re.compile(r'(?:embed/)([a-zA-Z0-9_-]{11})'),
+    re.compile(r'^([a-zA-Z0-9_-]{11})$'),
+]
+
 
 def extract_video_id(url: str) -> str | None:
     """Extract YouTube video ID from various URL formats."""
-    patterns = [
-        r'(?:v=|/v/|youtu\.be/)([a-zA-Z0-9_-]{11})',
-        r'(?:embed/)([a-zA-Z0-9_-]{11})',
-        r'^([a-zA-Z0-9_-]{11})$',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in VIDEO_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     return None
 
 
-def get_video_metadata(url: str) -> dict:
-    """Get video metadata using yt-dlp without downloading."""
-    result = subprocess.run(
-        [
-            "yt-dlp",
-            "--dump-json",
-            "--no-download",
-            url,
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error getting metadata: {result.stderr}")
-        sys.exit(1)
+def is_complete_download(video_path: Path, info: dict) -> bool:
+    """
+    Check whether an existing video file matches yt-dlp's expected size.
 
-    return json.loads(result.stdout)
-
-
-def download_video(url: str, output_path: Path) -> None:
-    """Download video using yt-dlp."""
-    print(f"Downloading video to {output_path}...")
-    result = subprocess.run(
-        [
-            "yt-dlp",
-            "-f", "bestvideo[ext=webm]+bestaudio[ext=webm]/best[ext=webm]/bestvideo+bestaudio/best",
-            "--merge-output-format", "webm",
-            "-o", str(output_path),
-            url,
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error downloading: {result.stderr}")
+    Files within 2% of the expected size are treated as complete. If yt-dlp
+    reports no size, any existing file is trusted.
+    """
+    if not video_path.exists():
+        return False
+    expected = info.get("filesize") or info.get("filesize_approx")
+    if not expected:
+        return True
+    return abs(video_path.stat().st_size - expected) < expected * SIZE_TOLERANCE
+
+
+def fetch_video(url: str, output_path: Path) -> dict:
+    """
+    Get video metadata and download the video using yt-dlp.
+
+    A single YoutubeDL instance handles both stages so the extracted info is
+    reused for the download instead of being fetched twice. An existing file
+    is kept only if its size matches the expected size; otherwise it is
+    treated as a stale partial download and fetched again.
+    """
+    with YoutubeDL({**YDL_OPTIONS, "outtmpl": str(output_path)}) as ydl:
+        try:
+            info = ydl.extract_info(url, download=False)
+        except DownloadError as e:
+            print(f"Error getting metadata: {e}")
+            sys.exit(1)
+
+        if is_complete_download(output_path, info):
+            print(f"Video already exists: {output_path}")
+            return info
+
+        if output_path.exists():
+            print(f"Existing video looks incomplete, re-downloading: {output_path}")
+            output_path.unlink()
+
+        print(f"Downloading video to {output_path}...")
+        try:
+            ydl.process_ie_result(info, download=True)
+        except DownloadError as e:
+            print(f"Error downloading: {e}")
+            sys.exit(1)
+        print("Download complete!")
+
+    return info
+
+
+async def preprocess_video(video_path: Path, output_path: Path) -> None:
+    """Downscale and drop the frame rate of a video with ffmpeg for a smaller upload."""
+    print(f"Preprocessing video to {output_path}...")
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-y",
+            "-i", str(video_path),
+            "-vf", f"scale=-2:{PREPROCESS_HEIGHT},fps={PREPROCESS_FPS}",
+            "-c:v", "libx264",
+            "-preset", "veryfast",
+            "-c:a", "aac",
+            "-movflags", "+faststart",
+            str(output_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        print("Error: ffmpeg not found (required for --preprocess)")
         sys.exit(1)
-    print("Download complete!")
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        print(f"Error preprocessing: {stderr.decode()}")
+        sys.exit(1)
+    print(f"Preprocessing complete! ({video_path.stat().st_size / 2**20:.1f} MB -> {output_path.stat().st_size / 2**20:.1f} MB)")
 
 
-def upload_to_gemini(video_path: Path) -> str:
+async def upload_to_gemini(video_path: Path) -> str:
     """Upload video to Gemini Files API and return file ID."""
     print(f"Uploading to Gemini Files API...")
-    client = genai.Client()
+    client = genai.Client(http_options=HTTP_OPTIONS)
 
     # Upload file
-    file = client.files.upload(file=video_path)
+    file = await client.aio.files.upload(file=video_path)
     print(f"Uploaded! File ID: {file.name}")
 
-    # Wait for processing
+    # Wait for processing, backing off from 0.5s up to 10s between polls
     print("Waiting for video processing...")
+    delay = 0.5
     while file.state.name == "PROCESSING":
-        import time
-        time.sleep(5)
-        file = client.files.get(name=file.name)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 10.0)
+        file = await client.aio.files.get(name=file.name)
 
     if file.state.name != "ACTIVE":
         print(f"Error: File state is {file.state.name}")
@@ -103,7 +165,7 @@ def upload_to_gemini(video_path: Path) -> str:
     return file.name
 
 
-def add_video(url: str, skip_upload: bool = False):
+async def add_video(url: str, skip_upload: bool = False, preprocess: bool = False):
     """Add a new video to the system."""
     video_id = extract_video_id(url)
     if not video_id:
@@ -120,27 +182,28 @@ def add_video(url: str, skip_upload: bool = False):
         if response.lower() != 'y':
             sys.exit(0)
 
-    # Get metadata
-    print("Fetching video metadata...")
-    yt_meta = get_video_metadata(url)
-
     # Create match directory
     match_dir.mkdir(parents=True, exist_ok=True)
     (match_dir / "results").mkdir(exist_ok=True)
 
-    # Download video
+    # Get metadata and download video
+    print("Fetching video metadata...")
     video_path = match_dir / "video.webm"
-    if not video_path.exists():
-        download_video(url, video_path)
-    else:
-        print(f"Video already exists: {video_path}")
+    yt_meta = await asyncio.to_thread(fetch_video, url, video_path)
 
-    # Upload to Gemini
+    # Upload to Gemini, optionally shrinking the video first; the original is kept for playback
     gemini_file_id = None
+    upload_path = None
     if not skip_upload:
-        gemini_file_id = upload_to_gemini(video_path)
+        upload_path = video_path
+        if preprocess:
+            upload_path = match_dir / "video.mp4"
+            await preprocess_video(video_path, upload_path)
+        gemini_file_id = await upload_to_gemini(upload_path)
     else:
         print("Skipping Gemini upload (--skip-upload flag)")
+        if preprocess:
+            print("Skipping preprocessing: nothing to upload")
 
     # Create metadata.json
     metadata = {
@@ -153,13 +216,14 @@ def add_video(url: str, skip_upload: bool = False):
         "upload_date": yt_meta.get("upload_date", ""),
         "thumbnail_url": yt_meta.get("thumbnail", f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg"),
         "video_filename": "video.webm",
+        "gemini_video_filename": upload_path.name if upload_path else None,
         "gemini_file_id": gemini_file_id,
         "added_at": datetime.now(timezone.utc).isoformat(),
     }
 
     metadata_path = match_dir / "metadata.json"
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    match_index.upsert_match(match_dir)
 
     print(f"\nMatch added successfully!")
     print(f"  Directory: {match_dir}")
@@ -174,9 +238,10 @@ def main():
     parser = argparse.ArgumentParser(description="Add a new video to the match analysis system")
     parser.add_argument("url", help="YouTube video URL")
     parser.add_argument("--skip-upload", action="store_true", help="Skip uploading to Gemini (for testing)")
+    parser.add_argument("--preprocess", action="store_true", help="Upload a 720p, 5 fps copy made with ffmpeg")
     args = parser.parse_args()
 
-    add_video(args.url, skip_upload=args.skip_upload)
+    asyncio.run(add_video(args.url, skip_upload=args.skip_upload, preprocess=args.preprocess))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
 import argparse
-import json
+import os
 import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
+import orjson
+
 MATCHES_DIR = Path("matches")
 
 
@@ -16,13 +21,17 @@ class MatchResult:
 
 
 def load_ground_truth(path: Path) -> dict:
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def load_result(path: Path) -> dict:
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
+
+
+def first_name(name: str) -> str | None:
+    """First word of an athlete name, or None for an empty or blank name."""
+    words = name.split() if name else []
+    return words[0] if words else None
 
 
 def normalize_athlete(athlete, athlete_1_name: str, athlete_2_name: str) -> str:
@@ -39,19 +48,37 @@ def normalize_athlete(athlete, athlete_1_name: str, athlete_2_name: str) -> str:
     if athlete == athlete_2_name:
         return "2"
     # Fallback: check if name contains athlete first name
-    if athlete_1_name and athlete_1_name.split()[0] in str(athlete):
+    athlete_1_first = first_name(athlete_1_name)
+    if athlete_1_first and athlete_1_first in str(athlete):
         return "1"
-    if athlete_2_name and athlete_2_name.split()[0] in str(athlete):
+    athlete_2_first = first_name(athlete_2_name)
+    if athlete_2_first and athlete_2_first in str(athlete):
         return "2"
     return "1"  # Default
 
 
 def normalize_events(events: list[dict], athlete_1_name: str, athlete_2_name: str) -> list[dict]:
-    """Normalize athlete fields in events to strings."""
-    return [
-        {**e, "athlete": normalize_athlete(e.get("athlete"), athlete_1_name, athlete_2_name)}
-        for e in events
-    ]
+    """
+    Normalize athlete fields in events to strings.
+
+    Events are updated in place (they come straight from freshly parsed JSON)
+    and the same list is returned. Each distinct athlete value is resolved by
+    normalize_athlete once and then served from a lookup table.
+    """
+    # Keyed by type as well, since True == 1 and 1.0 == 1 normalize differently
+    lookup = {}
+    for e in events:
+        athlete = e.get("athlete")
+        key = (type(athlete), athlete)
+        try:
+            normalized = lookup[key]
+        except KeyError:
+            normalized = lookup[key] = normalize_athlete(athlete, athlete_1_name, athlete_2_name)
+        except TypeError:
+            # Unhashable value, e.g. a list
+            normalized = normalize_athlete(athlete, athlete_1_name, athlete_2_name)
+        e["athlete"] = normalized
+    return events
 
 
 def match_events(
@@ -65,41 +92,25 @@ def match_events(
     Matching criteria: match_clock within tolerance AND same athlete.
     Uses greedy approach: for each GT event in order, find closest unmatched prediction.
     """
+    # Parse clocks and pull out compared fields once per event, not once per pair
+    assignment = greedy_match(
+        [e.get("athlete") for e in gt_events],
+        [parse_clock(e.get("match_clock", "")) for e in gt_events],
+        [e.get("timestamp_seconds", 0) for e in gt_events],
+        [e.get("athlete") for e in pred_events],
+        [parse_clock(e.get("match_clock", "")) for e in pred_events],
+        [e.get("timestamp_seconds", 0) for e in pred_events],
+        clock_tolerance,
+    )
+
     matches = []
-    used_pred_indices = set()
+    # used_preds[i] is set once prediction i has been matched
+    used_preds = bytearray(len(pred_events))
 
-    # For each ground truth event, find best matching prediction
     for gt_idx, gt_event in enumerate(gt_events):
-        best_pred_idx = None
-        best_time_diff = float('inf')
-
-        gt_clock = parse_clock(gt_event.get("match_clock", ""))
-
-        for pred_idx, pred_event in enumerate(pred_events):
-            if pred_idx in used_pred_indices:
-                continue
-
-            # Check athlete match
-            if gt_event.get("athlete") != pred_event.get("athlete"):
-                continue
-
-            # Check match_clock tolerance
-            pred_clock = parse_clock(pred_event.get("match_clock", ""))
-
-            if gt_clock is None or pred_clock is None:
-                # Fall back to timestamp_seconds if no clock
-                gt_time = gt_event.get("timestamp_seconds", 0)
-                pred_time = pred_event.get("timestamp_seconds", 0)
-                time_diff = abs(gt_time - pred_time)
-            else:
-                time_diff = abs(gt_clock - pred_clock)
-
-            if time_diff <= clock_tolerance and time_diff < best_time_diff:
-                best_time_diff = time_diff
-                best_pred_idx = pred_idx
-
+        best_pred_idx = assignment[gt_idx]
         if best_pred_idx is not None:
-            used_pred_indices.add(best_pred_idx)
+            used_preds[best_pred_idx] = 1
             matches.append(MatchResult(
                 gt_index=gt_idx,
                 pred_index=best_pred_idx,
@@ -117,7 +128,7 @@ def match_events(
 
     # Add false positives - predictions with no GT match
     for pred_idx, pred_event in enumerate(pred_events):
-        if pred_idx not in used_pred_indices:
+        if not used_preds[pred_idx]:
             matches.append(MatchResult(
                 gt_index=None,
                 pred_index=pred_idx,
@@ -128,78 +139,187 @@ def match_events(
     return matches
 
 
-def compute_detection_metrics(matches: list[MatchResult]) -> dict:
-    """Compute precision, recall, F1 for event detection."""
-    tp = sum(1 for m in matches if m.gt_event and m.pred_event)
-    fn = sum(1 for m in matches if m.gt_event and not m.pred_event)
-    fp = sum(1 for m in matches if not m.gt_event and m.pred_event)
+def greedy_match(
+    gt_athletes: list[str],
+    gt_clocks: list[int | None],
+    gt_times: list[int],
+    pred_athletes: list[str],
+    pred_clocks: list[int | None],
+    pred_times: list[int],
+    clock_tolerance: int,
+) -> list[int | None]:
+    """
+    Greedy matching over pre-extracted event fields.
 
-    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+    Returns, for each GT event, the index of its matched prediction or None.
+    Works only on plain lists, so callers sweeping clock_tolerance can parse
+    events once and re-run this directly.
+    """
+    # used_preds[i] is set once prediction i has been matched
+    used_preds = bytearray(len(pred_athletes))
+
+    # Only predictions for the same athlete can match. Each athlete's
+    # predictions are kept sorted by clock (and by timestamp for GT events
+    # without a clock) so candidates within tolerance are found by bisection.
+    pred_by_athlete: dict[str, list[int]] = {}
+    for pred_idx, athlete in enumerate(pred_athletes):
+        pred_by_athlete.setdefault(athlete, []).append(pred_idx)
+
+    buckets = {}
+    for athlete, pred_indices in pred_by_athlete.items():
+        clocked = sorted((pred_clocks[i], i) for i in pred_indices if pred_clocks[i] is not None)
+        timed = sorted((pred_times[i], i) for i in pred_indices)
+        buckets[athlete] = (
+            clocked,
+            [i for i in pred_indices if pred_clocks[i] is None],
+            timed,
+        )
 
-    return {
-        "true_positives": tp,
-        "false_negatives": fn,
-        "false_positives": fp,
-        "precision": precision,
-        "recall": recall,
-        "f1": f1,
-    }
+    # For each ground truth event, find best matching prediction
+    assignment = []
+    for gt_idx, athlete in enumerate(gt_athletes):
+        bucket = buckets.get(athlete)
+        if bucket is None:
+            best = None
+        elif gt_clocks[gt_idx] is None:
+            # Fall back to timestamp_seconds if no clock
+            best = _nearest_unused(bucket[2], gt_times[gt_idx], clock_tolerance, used_preds)
+        else:
+            clocked, unclocked, _ = bucket
+            best = _nearest_unused(clocked, gt_clocks[gt_idx], clock_tolerance, used_preds)
+            for pred_idx in unclocked:
+                if used_preds[pred_idx]:
+                    continue
+                time_diff = abs(gt_times[gt_idx] - pred_times[pred_idx])
+                if time_diff <= clock_tolerance and (best is None or (time_diff, pred_idx) < best):
+                    best = (time_diff, pred_idx)
+
+        if best is None:
+            assignment.append(None)
+        else:
+            used_preds[best[1]] = 1
+            assignment.append(best[1])
 
+    return assignment
 
-def compute_field_accuracy(matches: list[MatchResult]) -> dict:
-    """Compute field-level accuracy for matched events."""
-    matched = [m for m in matches if m.gt_event and m.pred_event]
 
-    if not matched:
-        return {}
+def _nearest_unused(
+    sorted_keys: list[tuple[int, int]],
+    target: int,
+    tolerance: int,
+    used: bytearray,
+) -> tuple[int, int] | None:
+    """
+    Find the closest unused (diff, pred_index) within tolerance of target.
 
-    fields = [
-        "points_change",
-        "advantages_change",
-        "penalties_change",
-        "action",
-        "running_score",
-        "running_advantages",
-        "running_penalties",
-        "match_clock",
-    ]
+    sorted_keys holds (value, pred_index) pairs sorted by value. Ties on
+    diff go to the lowest pred_index, matching a linear scan in index order.
+    """
+    best = None
+    for k in range(bisect_left(sorted_keys, (target - tolerance, -1)), len(sorted_keys)):
+        value, pred_idx = sorted_keys[k]
+        if value > target + tolerance:
+            break
+        if used[pred_idx]:
+            continue
+        candidate = (abs(value - target), pred_idx)
+        if best is None or candidate < best:
+            best = candidate
+    return best
+
+
+FIELDS = [
+    "points_change",
+    "advantages_change",
+    "penalties_change",
+    "action",
+    "running_score",
+    "running_advantages",
+    "running_penalties",
+    "match_clock",
+]
+
+
+def compute_all_metrics(matches: list[MatchResult]) -> dict:
+    """
+    Compute detection, field accuracy and clock accuracy metrics in one pass.
 
-    field_stats = {}
+    Detection: precision, recall, F1 over all matches.
+    Field accuracy: per-field correctness for matched events.
+    Clock accuracy: match clock error for matched events.
+    """
+    tp = fn = fp = 0
+    field_counts = {field: [0, 0] for field in FIELDS}  # [correct, total]
+    clock_errors = []
+
+    for m in matches:
+        if not (m.gt_event and m.pred_event):
+            if m.gt_event:
+                fn += 1
+            elif m.pred_event:
+                fp += 1
+            continue
+
+        tp += 1
+        gt_event = m.gt_event
+        pred_event = m.pred_event
 
-    for field in fields:
-        correct = 0
-        total = 0
+        gt_clock = parse_clock(gt_event.get("match_clock", ""))
+        pred_clock = parse_clock(pred_event.get("match_clock", ""))
+        if gt_clock is not None and pred_clock is not None:
+            clock_errors.append(abs(gt_clock - pred_clock))
 
-        for m in matched:
-            gt_val = m.gt_event.get(field)
-            pred_val = m.pred_event.get(field)
+        for field, counts in field_counts.items():
+            gt_val = gt_event.get(field)
 
             # Skip if ground truth doesn't have this field
             if gt_val is None or gt_val == "":
                 continue
 
-            total += 1
+            counts[1] += 1
 
             # For match_clock, use tolerance
             if field == "match_clock":
-                gt_seconds = parse_clock(gt_val)
-                pred_seconds = parse_clock(pred_val) if pred_val else None
-                if pred_seconds is not None and abs(gt_seconds - pred_seconds) <= 5:
-                    correct += 1
-            else:
-                if gt_val == pred_val:
-                    correct += 1
-
-        if total > 0:
-            field_stats[field] = {
-                "correct": correct,
-                "total": total,
-                "accuracy": correct / total,
-            }
+                if pred_clock is not None and abs(gt_clock - pred_clock) <= 5:
+                    counts[0] += 1
+            elif gt_val == pred_event.get(field):
+                counts[0] += 1
+
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+
+    field_stats = {
+        field: {
+            "correct": correct,
+            "total": total,
+            "accuracy": correct / total,
+        }
+        for field, (correct, total) in field_counts.items()
+        if total > 0
+    }
 
-    return field_stats
+    clock_stats = {}
+    if clock_errors:
+        clock_stats = {
+            "mean_absolute_error": sum(clock_errors) / len(clock_errors),
+            "max_error": max(clock_errors),
+            "min_error": min(clock_errors),
+            "matched_with_clock": len(clock_errors),
+        }
+
+    return {
+        "detection": {
+            "true_positives": tp,
+            "false_negatives": fn,
+            "false_positives": fp,
+            "precision": precision,
+            "recall": recall,
+            "f1": f1,
+        },
+        "field_accuracy": field_stats,
+        "clock_accuracy": clock_stats,
+    }
 
 
 def parse_clock(clock_str: str) -> int | None:
@@ -215,30 +335,29 @@ def parse_clock(clock_str: str) -> int | None:
         return None
 
 
-def compute_clock_accuracy(matches: list[MatchResult]) -> dict:
-    """Compute match clock accuracy metrics for matched events."""
-    matched = [m for m in matches if m.gt_event and m.pred_event]
-
-    if not matched:
-        return {}
-
-    errors = []
-    for m in matched:
-        gt_clock = parse_clock(m.gt_event.get("match_clock", ""))
-        pred_clock = parse_clock(m.pred_event.get("match_clock", ""))
-
-        if gt_clock is not None and pred_clock is not None:
-            errors.append(abs(gt_clock - pred_clock))
-
-    if not errors:
-        return {}
+def count_inversions(values: list[int]) -> int:
+    """
+    Count pairs i < j with values[i] > values[j] in O(K log K).
 
-    return {
-        "mean_absolute_error": sum(errors) / len(errors),
-        "max_error": max(errors),
-        "min_error": min(errors),
-        "matched_with_clock": len(errors),
-    }
+    Values must be distinct non-negative ints (pred indices). Walks right to
+    left, using a Fenwick tree to count smaller values already seen.
+    """
+    if not values:
+        return 0
+    tree = [0] * (max(values) + 2)
+    inversions = 0
+    for value in reversed(values):
+        # Count values seen so far (to the right) that are smaller
+        i = value
+        while i > 0:
+            inversions += tree[i]
+            i -= i & -i
+        # Record this value at position value + 1
+        i = value + 1
+        while i < len(tree):
+            tree[i] += 1
+            i += i & -i
+    return inversions
 
 
 def compute_sequence_metrics(matches: list[MatchResult]) -> dict:
@@ -258,16 +377,9 @@ def compute_sequence_metrics(matches: list[MatchResult]) -> dict:
         return {"pairs_in_order": 1.0, "total_pairs": 0, "inversions": 0}
 
     # Count inversions (pairs where pred order differs from GT order)
-    inversions = 0
-    total_pairs = 0
-
-    for i in range(len(matched)):
-        for j in range(i + 1, len(matched)):
-            total_pairs += 1
-            # GT order: i < j (by construction)
-            # Check if pred order agrees
-            if matched[i].pred_index > matched[j].pred_index:
-                inversions += 1
+    # GT order is ascending by construction, so only pred order matters
+    inversions = count_inversions([m.pred_index for m in matched])
+    total_pairs = len(matched) * (len(matched) - 1) // 2
 
     pairs_in_order = (total_pairs - inversions) / total_pairs if total_pairs > 0 else 1.0
 
@@ -311,6 +423,25 @@ def compute_match_level_metrics(gt_data: dict, pred_data: dict) -> dict:
 def evaluate(gt_path: Path, result_path: Path, clock_tolerance: int = 10) -> dict:
     """Run full evaluation and return metrics."""
     gt_data = load_ground_truth(gt_path)
+    return evaluate_result(gt_data, prepare_gt_events(gt_data), result_path, clock_tolerance)
+
+
+def prepare_gt_events(gt_data: dict) -> list[dict]:
+    """Normalize ground truth events once so they can be reused across result files."""
+    return normalize_events(
+        gt_data.get("events", []),
+        gt_data.get("athlete_1_name", ""),
+        gt_data.get("athlete_2_name", ""),
+    )
+
+
+def evaluate_result(
+    gt_data: dict,
+    gt_events: list[dict],
+    result_path: Path,
+    clock_tolerance: int = 10,
+) -> dict:
+    """Evaluate one result file against already-loaded ground truth."""
     result_data = load_result(result_path)
 
     # Get athlete names from ground truth (canonical source)
@@ -320,7 +451,6 @@ def evaluate(gt_path: Path, result_path: Path, clock_tolerance: int = 10) -> dic
 
     # Normalize ALL events using GT athlete names for consistent comparison
     # This ensures we compare the same actual athletes regardless of how they're labeled
-    gt_events = normalize_events(gt_data.get("events", []), gt_athlete_1, gt_athlete_2)
     pred_events = normalize_events(pred_analysis.get("events", []), gt_athlete_1, gt_athlete_2)
 
     matches = match_events(gt_events, pred_events, clock_tolerance)
@@ -334,9 +464,7 @@ def evaluate(gt_path: Path, result_path: Path, clock_tolerance: int = 10) -> dic
         "clock_tolerance": clock_tolerance,
         "gt_athlete_1": gt_athlete_1,
         "gt_athlete_2": gt_athlete_2,
-        "detection": compute_detection_metrics(matches),
-        "field_accuracy": compute_field_accuracy(matches),
-        "clock_accuracy": compute_clock_accuracy(matches),
+        **compute_all_metrics(matches),
         "sequence": compute_sequence_metrics(matches),
         "match_level": compute_match_level_metrics(gt_data, result_data),
         "matches": [
@@ -352,54 +480,55 @@ def evaluate(gt_path: Path, result_path: Path, clock_tolerance: int = 10) -> dic
     }
 
 
-def print_report(metrics: dict):
-    """Print a human-readable evaluation report."""
-    print("=" * 70)
-    print(f"EVALUATION REPORT: {metrics['result_file']}")
-    print(f"Model: {metrics['model']} | Resolution: {metrics['media_resolution']}")
-    print("=" * 70)
+def format_report(metrics: dict) -> str:
+    """Build a human-readable evaluation report."""
+    lines = []
+    lines.append("=" * 70)
+    lines.append(f"EVALUATION REPORT: {metrics['result_file']}")
+    lines.append(f"Model: {metrics['model']} | Resolution: {metrics['media_resolution']}")
+    lines.append("=" * 70)
 
-    print(f"\nEvents: {metrics['pred_event_count']} predicted vs {metrics['gt_event_count']} ground truth")
-    print(f"Clock tolerance: ±{metrics['clock_tolerance']}s (matching by match_clock)")
+    lines.append(f"\nEvents: {metrics['pred_event_count']} predicted vs {metrics['gt_event_count']} ground truth")
+    lines.append(f"Clock tolerance: ±{metrics['clock_tolerance']}s (matching by match_clock)")
 
     # Detection metrics
     det = metrics["detection"]
-    print(f"\n--- Event Detection ---")
-    print(f"  True Positives:  {det['true_positives']}")
-    print(f"  False Negatives: {det['false_negatives']} (missed events)")
-    print(f"  False Positives: {det['false_positives']} (hallucinated events)")
-    print(f"  Precision: {det['precision']:.1%}")
-    print(f"  Recall:    {det['recall']:.1%}")
-    print(f"  F1 Score:  {det['f1']:.1%}")
+    lines.append(f"\n--- Event Detection ---")
+    lines.append(f"  True Positives:  {det['true_positives']}")
+    lines.append(f"  False Negatives: {det['false_negatives']} (missed events)")
+    lines.append(f"  False Positives: {det['false_positives']} (hallucinated events)")
+    lines.append(f"  Precision: {det['precision']:.1%}")
+    lines.append(f"  Recall:    {det['recall']:.1%}")
+    lines.append(f"  F1 Score:  {det['f1']:.1%}")
 
     # Field accuracy
     if metrics["field_accuracy"]:
-        print(f"\n--- Field Accuracy (matched events only) ---")
+        lines.append(f"\n--- Field Accuracy (matched events only) ---")
         for field, stats in metrics["field_accuracy"].items():
-            print(f"  {field}: {stats['correct']}/{stats['total']} ({stats['accuracy']:.1%})")
+            lines.append(f"  {field}: {stats['correct']}/{stats['total']} ({stats['accuracy']:.1%})")
 
     # Clock accuracy
     if metrics["clock_accuracy"]:
         ca = metrics["clock_accuracy"]
-        print(f"\n--- Match Clock Accuracy ---")
-        print(f"  Mean Absolute Error: {ca['mean_absolute_error']:.1f}s")
-        print(f"  Range: {ca['min_error']:.0f}s - {ca['max_error']:.0f}s")
-        print(f"  Events with clock: {ca['matched_with_clock']}")
+        lines.append(f"\n--- Match Clock Accuracy ---")
+        lines.append(f"  Mean Absolute Error: {ca['mean_absolute_error']:.1f}s")
+        lines.append(f"  Range: {ca['min_error']:.0f}s - {ca['max_error']:.0f}s")
+        lines.append(f"  Events with clock: {ca['matched_with_clock']}")
 
     # Sequence metrics
     seq = metrics["sequence"]
-    print(f"\n--- Sequence Ordering ---")
-    print(f"  Pairs in correct order: {seq['pairs_in_order']:.1%}")
-    print(f"  Inversions: {seq['inversions']}/{seq['total_pairs']}")
+    lines.append(f"\n--- Sequence Ordering ---")
+    lines.append(f"  Pairs in correct order: {seq['pairs_in_order']:.1%}")
+    lines.append(f"  Inversions: {seq['inversions']}/{seq['total_pairs']}")
 
     # Match-level metrics
     ml = metrics["match_level"]
-    print(f"\n--- Match-Level ---")
-    print(f"  Final Score: {'✓' if ml['final_score_correct'] else '✗'} (GT: {ml['gt_final_score']}, Pred: {ml['pred_final_score']})")
-    print(f"  Winner: {'✓' if ml['winner_correct'] else '✗'} (GT: {ml['gt_winner']}, Pred: {ml['pred_winner']})")
+    lines.append(f"\n--- Match-Level ---")
+    lines.append(f"  Final Score: {'✓' if ml['final_score_correct'] else '✗'} (GT: {ml['gt_final_score']}, Pred: {ml['pred_final_score']})")
+    lines.append(f"  Winner: {'✓' if ml['winner_correct'] else '✗'} (GT: {ml['gt_winner']}, Pred: {ml['pred_winner']})")
 
     # Detailed event matching
-    print(f"\n--- Event Matching Detail ---")
+    lines.append(f"\n--- Event Matching Detail ---")
     gt_names = {"1": metrics.get("gt_athlete_1", "A1"), "2": metrics.get("gt_athlete_2", "A2")}
 
     def athlete_label(athlete_num):
@@ -412,17 +541,23 @@ def print_report(metrics: dict):
             pred = m["pred_event"]
             gt_clock = gt.get("match_clock", "?")
             pred_clock = pred.get("match_clock", "?")
-            print(f"  ✓ GT[{m['gt_index']}] ↔ Pred[{m['pred_index']}]: {athlete_label(gt['athlete'])} @ {gt_clock} → {pred_clock} | {gt['action']}")
+            lines.append(f"  ✓ GT[{m['gt_index']}] ↔ Pred[{m['pred_index']}]: {athlete_label(gt['athlete'])} @ {gt_clock} → {pred_clock} | {gt['action']}")
         elif m["gt_event"]:
             gt = m["gt_event"]
             gt_clock = gt.get("match_clock", "?")
-            print(f"  ✗ MISSED GT[{m['gt_index']}]: {athlete_label(gt['athlete'])} @ {gt_clock} | {gt['action']}")
+            lines.append(f"  ✗ MISSED GT[{m['gt_index']}]: {athlete_label(gt['athlete'])} @ {gt_clock} | {gt['action']}")
         else:
             pred = m["pred_event"]
             pred_clock = pred.get("match_clock", "?")
-            print(f"  ✗ EXTRA Pred[{m['pred_index']}]: A{pred['athlete']} @ {pred_clock} | {pred['action']}")
+            lines.append(f"  ✗ EXTRA Pred[{m['pred_index']}]: A{pred['athlete']} @ {pred_clock} | {pred['action']}")
+
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
 
-    print()
+def print_report(metrics: dict):
+    """Print a human-readable evaluation report."""
+    sys.stdout.write(format_report(metrics))
 
 
 def list_matches():
@@ -430,17 +565,21 @@ def list_matches():
     if not MATCHES_DIR.exists():
         return []
 
+    # scandir caches each entry's type, so is_dir() needs no extra stat
+    with os.scandir(MATCHES_DIR) as it:
+        match_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
     matches = []
-    for match_dir in sorted(MATCHES_DIR.iterdir()):
-        if match_dir.is_dir():
-            metadata_path = match_dir / "metadata.json"
-            if metadata_path.exists():
-                with open(metadata_path) as f:
-                    metadata = json.load(f)
-                matches.append({
-                    "video_id": match_dir.name,
-                    "title": metadata.get("title", match_dir.name),
-                })
+    for match_dir in match_dirs:
+        try:
+            with open(os.path.join(match_dir.path, "metadata.json"), "rb") as f:
+                metadata = orjson.loads(f.read())
+        except FileNotFoundError:
+            continue
+        matches.append({
+            "video_id": match_dir.name,
+            "title": metadata.get("title", match_dir.name),
+        })
     return matches
 
 
@@ -490,10 +629,16 @@ def main():
         print("No result files found")
         sys.exit(1)
 
-    all_metrics = []
-    for result_path in result_files:
-        metrics = evaluate(gt_path, result_path)
-        all_metrics.append(metrics)
+    # Load ground truth once, then evaluate result files in parallel
+    gt_data = load_ground_truth(gt_path)
+    eval_one = partial(evaluate_result, gt_data, prepare_gt_events(gt_data))
+    if len(result_files) > 1:
+        with ProcessPoolExecutor() as executor:
+            all_metrics = list(executor.map(eval_one, result_files))
+    else:
+        all_metrics = [eval_one(result_files[0])]
+
+    for metrics in all_metrics:
         print_report(metrics)
 
     # Summary comparison if multiple files
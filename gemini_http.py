@@ -0,0 +1,17 @@
+"""
+HTTP settings for every Gemini client (analysis in main.py, uploads in add_video.py).
+"""
+
+from google.genai import types
+
+# Per-request timeout in milliseconds (also sent to the server as its deadline),
+# plus SDK-level exponential backoff on 429 and 5xx
+HTTP_OPTIONS = types.HttpOptions(
+    timeout=600_000,
+    retry_options=types.HttpRetryOptions(
+        attempts=5,
+        initial_delay=2.0,
+        exp_base=2,
+        http_status_codes=[429, 500, 502, 503, 504],
+    ),
+)
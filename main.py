@@ -1,5 +1,8 @@
 import argparse
+import asyncio
+import functools
 import json
+import string
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -7,8 +10,12 @@ from pathlib import Path
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
+from pydantic import TypeAdapter
 
+from gemini_http import HTTP_OPTIONS
+import match_index
 from models import AnalysisRun, AthleteIdentification, MatchAnalysis
+from storage import write_atomic
 
 load_dotenv()
 
@@ -19,6 +26,21 @@ THINKING_LEVEL = "HIGH"  # or "HIGH", "LOW"
 
 MATCHES_DIR = Path("matches")
 RULEBOOK_FILE_ID = "files/dp6aqz2vzmq3"  # Global rulebook
+MAX_CONCURRENT_MATCHES = 4  # Matches analyzed at once in batch mode
+
+# Built once at import and reused to validate every Gemini response
+MATCH_ADAPTER = TypeAdapter(MatchAnalysis)
+ATHLETE_ADAPTER = TypeAdapter(AthleteIdentification)
+
+# JSON schemas for response_schema, generated once instead of on every call
+MATCH_SCHEMA = MatchAnalysis.model_json_schema()
+ATHLETE_SCHEMA = AthleteIdentification.model_json_schema()
+
+# Batch mode: one request returns a list of analyses, one per video
+MATCH_BATCH_ADAPTER = TypeAdapter(list[MatchAnalysis])
+MATCH_BATCH_SCHEMA = MATCH_BATCH_ADAPTER.json_schema()
+MAX_BATCH_VIDEO_SECONDS = 45 * 60  # Keeps videos + rulebook within the context window
+DEFAULT_MATCH_SECONDS = 10 * 60  # Assumed length when metadata has no duration
 
 ATHLETE_ID_PROMPT = """Look at the scoreboard overlay in this BJJ match video.
 
@@ -36,13 +58,15 @@ For each athlete, record:
 
 Also identify the single most reliable way to tell them apart during action (usually gi color)."""
 
-PROMPT_TEMPLATE = """You are analyzing a BJJ (Brazilian Jiu-Jitsu) competition match video. You have been provided:
+PROMPT_INTRO = """You are analyzing a BJJ (Brazilian Jiu-Jitsu) competition match video. You have been provided:
 1. The match video
 2. The official IBJJF Rules Book PDF
 
 Your task is to identify and record every scoring change (points, advantages, or penalties) throughout the match.
 
-## Athlete Identification (use this throughout the match)
+"""
+
+ATHLETE_CONTEXT_TEMPLATE = """## Athlete Identification (use this throughout the match)
 
 **Athlete 1 (LEFT side of scoreboard):**
 - Name: {athlete_1_name}
@@ -56,7 +80,9 @@ Your task is to identify and record every scoring change (points, advantages, or
 
 **How to tell them apart:** {distinguishing_feature}
 
-## How to Identify Scoring Events
+"""
+
+SCORING_INSTRUCTIONS = """## How to Identify Scoring Events
 
 1. **Watch the referee** - The referee signals scoring with hand gestures and the scoreboard updates shortly after.
 
@@ -109,7 +135,23 @@ When positions flow continuously, points accumulate. Watch for these patterns:
 
 Record events when the referee signals or the scoreboard updates, not when the action begins."""
 
-client = genai.Client()
+# ATHLETE_CONTEXT_TEMPLATE split once into (literal text, field name) pairs
+ATHLETE_CONTEXT_PARTS = tuple(
+    (literal, field) for literal, field, _, _ in string.Formatter().parse(ATHLETE_CONTEXT_TEMPLATE)
+)
+
+BATCH_PROMPT_INTRO = """You are analyzing {match_count} separate BJJ (Brazilian Jiu-Jitsu) competition match videos. You have been provided:
+1. The match videos, each preceded by its label ("Match 1", "Match 2", ...)
+2. The official IBJJF Rules Book PDF
+
+Analyze each match independently. Return one analysis per match, in the same order as the videos. For each match, identify and record every scoring change (points, advantages, or penalties) throughout the match.
+
+"""
+
+client = genai.Client(http_options=HTTP_OPTIONS)
+
+# Gemini file lookups by file ID, shared across matches (e.g. the rulebook)
+_file_cache: dict[str, asyncio.Future] = {}
 
 
 def list_matches():
@@ -117,106 +159,167 @@ def list_matches():
     if not MATCHES_DIR.exists():
         print("No matches directory found.")
         return []
+    return match_index.list_matches()
 
-    matches = []
-    for match_dir in sorted(MATCHES_DIR.iterdir()):
-        if match_dir.is_dir():
-            metadata_path = match_dir / "metadata.json"
-            if metadata_path.exists():
-                with open(metadata_path) as f:
-                    metadata = json.load(f)
-                matches.append({
-                    "video_id": match_dir.name,
-                    "title": metadata.get("title", match_dir.name),
-                })
-
-    return matches
-
-
-def get_file(file_id: str, description: str):
-    """Get a file by ID, verify it's active."""
+
+async def fetch_file(file_id: str, description: str):
+    """Fetch a file by ID, verify it's active."""
     print(f"Loading {description}: {file_id}")
-    file = client.files.get(name=file_id)
+    file = await client.aio.files.get(name=file_id)
     if file.state.name != "ACTIVE":
         raise RuntimeError(f"{description} not active: {file.state.name}")
     return file
 
 
-def identify_athletes(video_file) -> AthleteIdentification:
+async def get_file(file_id: str, description: str):
+    """
+    Get an active file by ID, reusing earlier lookups in this process.
+
+    Concurrent callers share one in-flight request. Failed lookups (including
+    files that are not active yet) are dropped from the cache so the next
+    call fetches again.
+    """
+    task = _file_cache.get(file_id)
+    if task is None:
+        task = asyncio.ensure_future(fetch_file(file_id, description))
+        _file_cache[file_id] = task
+    try:
+        return await task
+    except Exception:
+        if _file_cache.get(file_id) is task:
+            del _file_cache[file_id]
+        raise
+
+
+async def identify_athletes(video_file) -> AthleteIdentification:
     """Identify athletes from the video before main analysis."""
     print("Step 1: Identifying athletes with gemini-2.5-pro...")
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model="gemini-2.5-pro",
         contents=[video_file, ATHLETE_ID_PROMPT],
         config=types.GenerateContentConfig(
             media_resolution="MEDIA_RESOLUTION_HIGH",
             thinking_config=types.ThinkingConfig(thinking_budget=10000),
             response_mime_type="application/json",
-            response_schema=AthleteIdentification,
+            response_schema=ATHLETE_SCHEMA,
         ),
     )
-    return AthleteIdentification.model_validate_json(response.text)
+    return ATHLETE_ADAPTER.validate_json(response.text)
 
 
-def analyze_match(match_id: str):
-    """Analyze a match by its video ID."""
+def load_match(match_id: str) -> tuple[Path, dict]:
+    """Load a match's directory and metadata, verifying it has a Gemini file."""
     match_dir = MATCHES_DIR / match_id
     metadata_path = match_dir / "metadata.json"
 
     if not metadata_path.exists():
-        print(f"Match not found: {match_id}")
-        sys.exit(1)
+        raise RuntimeError(f"Match not found: {match_id}")
 
     with open(metadata_path) as f:
         metadata = json.load(f)
 
-    video_file_id = metadata.get("gemini_file_id")
-    video_filename = metadata.get("video_filename", "video.webm")
+    if not metadata.get("gemini_file_id"):
+        raise RuntimeError(f"No Gemini file ID for match: {match_id}")
 
-    if not video_file_id:
-        print(f"No Gemini file ID for match: {match_id}")
-        sys.exit(1)
+    return match_dir, metadata
+
+
+def format_athlete_context(athletes: AthleteIdentification) -> dict:
+    """Prompt template fields describing the identified athletes."""
+    return {
+        "athlete_1_name": athletes.athlete_1.name,
+        "athlete_1_gi": athletes.athlete_1.gi_color,
+        "athlete_1_description": athletes.athlete_1.physical_description,
+        "athlete_2_name": athletes.athlete_2.name,
+        "athlete_2_gi": athletes.athlete_2.gi_color,
+        "athlete_2_description": athletes.athlete_2.physical_description,
+        "distinguishing_feature": athletes.distinguishing_feature,
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def athlete_context(athletes: AthleteIdentification) -> str:
+    """ATHLETE_CONTEXT_TEMPLATE filled in for the identified athletes (frozen models hash by value)."""
+    fields = format_athlete_context(athletes)
+    return "".join(literal + (fields[field] if field else "") for literal, field in ATHLETE_CONTEXT_PARTS)
+
+
+def print_athletes(athletes: AthleteIdentification):
+    """Print a summary of the identified athletes."""
+    print(f"  Athlete 1: {athletes.athlete_1.name} ({athletes.athlete_1.gi_color} gi)")
+    print(f"  Athlete 2: {athletes.athlete_2.name} ({athletes.athlete_2.gi_color} gi)")
+    print(f"  Distinguishing feature: {athletes.distinguishing_feature}")
+
+
+def analysis_config(response_schema: dict) -> types.GenerateContentConfig:
+    """Generation config for the main analysis call."""
+    return types.GenerateContentConfig(
+        media_resolution=MEDIA_RESOLUTION,
+        thinking_config=types.ThinkingConfig(thinking_budget=10000) if THINKING_LEVEL == "HIGH" else (types.ThinkingConfig(thinking_budget=1000) if THINKING_LEVEL == "LOW" else None),
+        response_mime_type="application/json",
+        response_schema=response_schema,
+    )
+
+
+def save_run(match_dir: Path, run: AnalysisRun, suffix: str = "") -> Path:
+    """Save a run to the match's results directory and return its path."""
+    results_dir = match_dir / "results"
+    results_dir.mkdir(exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{timestamp}_{MODEL}_{MEDIA_RESOLUTION}_thinking-{THINKING_LEVEL}{suffix}.json"
+    output_path = results_dir / filename
+
+    write_atomic(output_path, run.model_dump_json(indent=2).encode())
+
+    return output_path
+
+
+def print_analysis(analysis: MatchAnalysis):
+    """Print the events and result of an analysis."""
+    print(f"\nFound {len(analysis.events)} scoring events")
+    print(f"Final score: {analysis.final_score}")
+    print(f"Winner: {analysis.winner}")
+
+    # Print events summary
+    print("\nEvents:")
+    for event in analysis.events:
+        change = f"+{event.points_change} pts" if event.points_change else f"+{event.advantages_change} adv"
+        print(f"  {event.timestamp_seconds:>4}s | {event.athlete:<20} | {change:<10} | {event.action}")
+
+
+async def analyze_match(match_id: str):
+    """Analyze a match by its video ID."""
+    match_dir, metadata = load_match(match_id)
+    video_filename = metadata.get("video_filename", "video.webm")
 
     print(f"Analyzing match: {metadata.get('title', match_id)}")
 
     # Load video and rulebook
-    video = get_file(video_file_id, "video")
-    rulebook = get_file(RULEBOOK_FILE_ID, "rulebook")
+    video, rulebook = await asyncio.gather(
+        get_file(metadata["gemini_file_id"], "video"),
+        get_file(RULEBOOK_FILE_ID, "rulebook"),
+    )
     print("Files ready!")
 
     # Step 1: Identify athletes
-    athletes = identify_athletes(video)
-    print(f"  Athlete 1: {athletes.athlete_1.name} ({athletes.athlete_1.gi_color} gi)")
-    print(f"  Athlete 2: {athletes.athlete_2.name} ({athletes.athlete_2.gi_color} gi)")
-    print(f"  Distinguishing feature: {athletes.distinguishing_feature}")
+    athletes = await identify_athletes(video)
+    print_athletes(athletes)
 
     # Build prompt with athlete context
-    prompt = PROMPT_TEMPLATE.format(
-        athlete_1_name=athletes.athlete_1.name,
-        athlete_1_gi=athletes.athlete_1.gi_color,
-        athlete_1_description=athletes.athlete_1.physical_description,
-        athlete_2_name=athletes.athlete_2.name,
-        athlete_2_gi=athletes.athlete_2.gi_color,
-        athlete_2_description=athletes.athlete_2.physical_description,
-        distinguishing_feature=athletes.distinguishing_feature,
-    )
+    prompt = "".join((PROMPT_INTRO, athlete_context(athletes), SCORING_INSTRUCTIONS))
 
     # Step 2: Analyze match with athlete context
     print(f"\nStep 2: Analyzing match with {MODEL} at {MEDIA_RESOLUTION} resolution...")
     print("Sending video + rulebook + prompt to Gemini...")
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=MODEL,
         contents=[video, rulebook, prompt],
-        config=types.GenerateContentConfig(
-            media_resolution=MEDIA_RESOLUTION,
-            thinking_config=types.ThinkingConfig(thinking_budget=10000) if THINKING_LEVEL == "HIGH" else (types.ThinkingConfig(thinking_budget=1000) if THINKING_LEVEL == "LOW" else None),
-            response_mime_type="application/json",
-            response_schema=MatchAnalysis,
-        ),
+        config=analysis_config(MATCH_SCHEMA),
     )
 
     # Parse and validate response
-    analysis = MatchAnalysis.model_validate_json(response.text)
+    analysis = MATCH_ADAPTER.validate_json(response.text)
 
     # Create run record
     run = AnalysisRun(
@@ -227,34 +330,140 @@ def analyze_match(match_id: str):
         analysis=analysis,
     )
 
-    # Save to match's results directory
-    results_dir = match_dir / "results"
-    results_dir.mkdir(exist_ok=True)
+    output_path = save_run(match_dir, run)
+    print(f"\nSaved to {output_path}")
+    print_analysis(analysis)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{MODEL}_{MEDIA_RESOLUTION}_thinking-{THINKING_LEVEL}.json"
-    output_path = results_dir / filename
+    print(f"\nTokens used: {response.usage_metadata}")
 
-    with open(output_path, "w") as f:
-        f.write(run.model_dump_json(indent=2))
 
-    print(f"\nSaved to {output_path}")
-    print(f"\nFound {len(analysis.events)} scoring events")
-    print(f"Final score: {analysis.final_score}")
-    print(f"Winner: {analysis.winner}")
+def plan_batches(matches: list[tuple[str, dict]]) -> list[list[tuple[str, dict]]]:
+    """
+    Group matches into batches whose combined video length fits one request.
+
+    Matches keep their order; a match longer than the limit gets its own batch.
+    """
+    batches = []
+    current = []
+    current_seconds = 0
+    for match in matches:
+        seconds = match[1].get("duration_seconds") or DEFAULT_MATCH_SECONDS
+        if current and current_seconds + seconds > MAX_BATCH_VIDEO_SECONDS:
+            batches.append(current)
+            current, current_seconds = [], 0
+        current.append(match)
+        current_seconds += seconds
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def analyze_batch(batch: list[tuple[str, dict]]):
+    """Analyze several matches with a single Gemini request."""
+    match_ids = [match_id for match_id, _ in batch]
+    print(f"Analyzing {len(batch)} matches in one request: {', '.join(match_ids)}")
+
+    # Load videos and rulebook
+    rulebook, *videos = await asyncio.gather(
+        get_file(RULEBOOK_FILE_ID, "rulebook"),
+        *[get_file(metadata["gemini_file_id"], f"video {match_id}") for match_id, metadata in batch],
+    )
+    print("Files ready!")
 
-    # Print events summary
-    print("\nEvents:")
-    for event in analysis.events:
-        change = f"+{event.points_change} pts" if event.points_change else f"+{event.advantages_change} adv"
-        print(f"  {event.timestamp_seconds:>4}s | {event.athlete:<20} | {change:<10} | {event.action}")
+    # Step 1: Identify athletes per video
+    all_athletes = await asyncio.gather(*[identify_athletes(video) for video in videos])
+    for match_id, athletes in zip(match_ids, all_athletes):
+        print(f"{match_id}:")
+        print_athletes(athletes)
+
+    # Build one prompt: shared instructions once, athlete context per match
+    sections = [BATCH_PROMPT_INTRO.format(match_count=len(batch))]
+    for i, athletes in enumerate(all_athletes, start=1):
+        sections.append(f"# Match {i}\n\n")
+        sections.append(athlete_context(athletes))
+    sections.append(SCORING_INSTRUCTIONS)
+    prompt = "".join(sections)
+
+    contents = [rulebook]
+    for i, video in enumerate(videos, start=1):
+        contents.extend([f"Match {i}", video])
+    contents.append(prompt)
+
+    # Step 2: Analyze all matches in one request
+    print(f"\nStep 2: Analyzing {len(batch)} matches with {MODEL} at {MEDIA_RESOLUTION} resolution...")
+    response = await client.aio.models.generate_content(
+        model=MODEL,
+        contents=contents,
+        config=analysis_config(MATCH_BATCH_SCHEMA),
+    )
+
+    analyses = MATCH_BATCH_ADAPTER.validate_json(response.text)
+    if len(analyses) != len(batch):
+        raise RuntimeError(f"Expected {len(batch)} analyses, got {len(analyses)}")
+
+    for (match_id, metadata), analysis in zip(batch, analyses):
+        run = AnalysisRun(
+            model=MODEL,
+            media_resolution=MEDIA_RESOLUTION,
+            video_file=metadata.get("video_filename", "video.webm"),
+            prompt=prompt,
+            analysis=analysis,
+        )
+        output_path = save_run(MATCHES_DIR / match_id, run, suffix="_batch")
+        print(f"\n{match_id}: saved to {output_path}")
+        print_analysis(analysis)
 
     print(f"\nTokens used: {response.usage_metadata}")
 
 
+async def analyze_matches_batch(match_ids: list[str]) -> bool:
+    """Analyze matches in as few requests as fit. Returns True if all succeeded."""
+    matches = []
+    ok = True
+    for match_id in match_ids:
+        try:
+            _, metadata = load_match(match_id)
+        except RuntimeError as e:
+            print(f"\nFailed to analyze {match_id}: {e}")
+            ok = False
+            continue
+        matches.append((match_id, metadata))
+
+    for batch in plan_batches(matches):
+        try:
+            await analyze_batch(batch)
+        except Exception as e:
+            print(f"\nFailed to analyze {', '.join(m for m, _ in batch)}: {e}")
+            ok = False
+    return ok
+
+
+async def run_all(match_ids: list[str]) -> bool:
+    """Analyze matches concurrently. Returns True if every match succeeded."""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_MATCHES)
+
+    async def run_one(match_id: str):
+        async with sem:
+            await analyze_match(match_id)
+
+    results = await asyncio.gather(
+        *[run_one(match_id) for match_id in match_ids],
+        return_exceptions=True,
+    )
+
+    ok = True
+    for match_id, result in zip(match_ids, results):
+        if isinstance(result, Exception):
+            print(f"\nFailed to analyze {match_id}: {result}")
+            ok = False
+    return ok
+
+
 def main():
     parser = argparse.ArgumentParser(description="Analyze BJJ match videos")
-    parser.add_argument("--match", "-m", help="Match video ID to analyze")
+    parser.add_argument("--match", "-m", nargs="+", help="Match video ID(s) to analyze")
+    parser.add_argument("--all", "-a", action="store_true", help="Analyze all matches")
+    parser.add_argument("--batch", "-b", action="store_true", help="Analyze multiple matches in a single request")
     parser.add_argument("--list", "-l", action="store_true", help="List available matches")
     args = parser.parse_args()
 
@@ -268,8 +477,15 @@ def main():
             print("No matches found. Add videos using add_video.py")
         return
 
-    if args.match:
-        analyze_match(args.match)
+    if args.all:
+        match_ids = [m["video_id"] for m in list_matches()]
+    else:
+        match_ids = args.match
+
+    if match_ids:
+        runner = analyze_matches_batch if args.batch else run_all
+        if not asyncio.run(runner(match_ids)):
+            sys.exit(1)
     else:
         # Default: list matches
         matches = list_matches()
@@ -0,0 +1,120 @@
+"""
+SQLite index of match metadata.
+
+Listing matches is one SELECT against matches.sqlite instead of opening every
+matches/<video_id>/metadata.json. The index is rebuilt from disk when it is
+first used and whenever a match directory is added or removed. Otherwise each
+listing only stats the indexed metadata.json files and re-reads the ones whose
+mtime changed. A directory whose metadata.json appears after it was scanned is
+picked up by upsert_match(), which add_video.py and the migration call.
+"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+
+import orjson
+
+MATCHES_DIR = Path("matches")
+INDEX_PATH = Path("matches.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    video_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    thumbnail_url TEXT NOT NULL,
+    mtime INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS index_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER
+);
+"""
+
+UPSERT_SQL = "INSERT OR REPLACE INTO matches (video_id, title, thumbnail_url, mtime) VALUES (?, ?, ?, ?)"
+
+# Threads for reading metadata.json files during a rebuild
+REBUILD_WORKERS = 16
+
+
+def connect() -> sqlite3.Connection:
+    """Open the index, creating its tables if needed."""
+    conn = sqlite3.connect(INDEX_PATH)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def read_match_row(match_dir: Path) -> tuple | None:
+    """Index row for one match directory, or None if it has no metadata.json."""
+    metadata_path = match_dir / "metadata.json"
+    try:
+        mtime = metadata_path.stat().st_mtime_ns
+        metadata = orjson.loads(metadata_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    return (
+        match_dir.name,
+        metadata.get("title", match_dir.name),
+        metadata.get("thumbnail_url", ""),
+        mtime,
+    )
+
+
+def _rebuild_index(conn: sqlite3.Connection):
+    """Replace the indexed rows with a fresh scan of MATCHES_DIR."""
+    dir_mtime = MATCHES_DIR.stat().st_mtime_ns
+    match_dirs = sorted(d for d in MATCHES_DIR.iterdir() if d.is_dir())
+    with ThreadPoolExecutor(max_workers=REBUILD_WORKERS) as pool:
+        rows = list(pool.map(read_match_row, match_dirs))
+    indexed = [row for row in rows if row is not None]
+
+    conn.execute("DELETE FROM matches")
+    conn.executemany(UPSERT_SQL, indexed)
+    conn.execute(
+        "INSERT OR REPLACE INTO index_state (key, value) VALUES ('matches_dir_mtime', ?)",
+        (dir_mtime,),
+    )
+
+
+def _refresh_changed(conn: sqlite3.Connection):
+    """Re-read indexed matches whose metadata.json changed or disappeared since it was indexed."""
+    for video_id, indexed_mtime in conn.execute("SELECT video_id, mtime FROM matches").fetchall():
+        match_dir = MATCHES_DIR / video_id
+        try:
+            mtime = (match_dir / "metadata.json").stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == indexed_mtime:
+            continue
+        row = read_match_row(match_dir)
+        if row is None:
+            conn.execute("DELETE FROM matches WHERE video_id = ?", (video_id,))
+        else:
+            conn.execute(UPSERT_SQL, row)
+
+
+def list_matches() -> list[dict]:
+    """All matches ordered by video ID, as dicts of video_id, title and thumbnail_url."""
+    if not MATCHES_DIR.exists():
+        return []
+
+    with closing(connect()) as conn, conn:
+        # Adding or removing a match directory bumps MATCHES_DIR's mtime
+        state = conn.execute("SELECT value FROM index_state WHERE key = 'matches_dir_mtime'").fetchone()
+        if state is None or state["value"] != MATCHES_DIR.stat().st_mtime_ns:
+            _rebuild_index(conn)
+        else:
+            _refresh_changed(conn)
+        rows = conn.execute("SELECT video_id, title, thumbnail_url FROM matches ORDER BY video_id")
+        return [dict(row) for row in rows]
+
+
+def upsert_match(match_dir: Path):
+    """Add or refresh one match's row after its metadata.json is written."""
+    row = read_match_row(match_dir)
+    if row is None:
+        return
+    with closing(connect()) as conn, conn:
+        conn.execute(UPSERT_SQL, row)
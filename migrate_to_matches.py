@@ -10,21 +10,56 @@ This is a one-time migration script that:
 """
 
 import json
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import match_index
+
 PROJECT_ROOT = Path(__file__).parent
 MATCHES_DIR = PROJECT_ROOT / "matches"
+COPY_WORKERS = 8
+
+# '[videoId]' in a filename, and a trailing bracketed suffix on a title
+VIDEO_ID_RE = re.compile(r"\[([a-zA-Z0-9_-]{11})\]")
+TITLE_SUFFIX_RE = re.compile(r"\s*\[[^\]]+\]\s*$")
 
 
 def extract_video_id(filename: str) -> str | None:
     """Extract YouTube video ID from filename like 'Title [videoId].webm'"""
-    match = re.search(r"\[([a-zA-Z0-9_-]{11})\]", filename)
+    match = VIDEO_ID_RE.search(filename)
     return match.group(1) if match else None
 
 
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a large file without bouncing it through userspace.
+
+    Uses os.copy_file_range, which lets the kernel clone extents (reflink)
+    on filesystems that support it and otherwise copies in-kernel. Falls
+    back to shutil.copyfile where copy_file_range is unavailable or fails
+    (e.g. across filesystems on older kernels).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 def migrate():
     # Find the existing video file
     video_files = list(PROJECT_ROOT.glob("*.webm"))
@@ -61,7 +96,7 @@ def migrate():
 
     # Create metadata.json
     # Extract title from filename (remove extension and video ID bracket)
-    title = re.sub(r"\s*\[[^\]]+\]\s*$", "", video_file.stem)
+    title = TITLE_SUFFIX_RE.sub("", video_file.stem)
 
     metadata = {
         "video_id": video_id,
@@ -80,13 +115,16 @@ def migrate():
     metadata_path = match_dir / "metadata.json"
     with open(metadata_path, "w") as f:
         json.dump(metadata, f, indent=2)
+    match_index.upsert_match(match_dir)
     print(f"Created: {metadata_path}")
 
+    # Collect files to copy as (copy function, source, destination, message)
+    copies = []
+
     # Move video file
     dest_video = match_dir / "video.webm"
     if not dest_video.exists():
-        shutil.copy2(video_file, dest_video)
-        print(f"Copied video to: {dest_video}")
+        copies.append((fast_copy, video_file, dest_video, f"Copied video to: {dest_video}"))
     else:
         print(f"Video already exists: {dest_video}")
 
@@ -94,23 +132,27 @@ def migrate():
     gt_path = PROJECT_ROOT / "ground_truth.json"
     if gt_path.exists():
         dest_gt = match_dir / "ground_truth.json"
-        shutil.copy2(gt_path, dest_gt)
-        print(f"Copied: {gt_path.name} -> {dest_gt}")
+        copies.append((shutil.copy2, gt_path, dest_gt, f"Copied: {gt_path.name} -> {dest_gt}"))
 
     # Move athlete_id_ground_truth.json
     athlete_gt_path = PROJECT_ROOT / "athlete_id_ground_truth.json"
     if athlete_gt_path.exists():
         dest_athlete_gt = match_dir / "athlete_id_ground_truth.json"
-        shutil.copy2(athlete_gt_path, dest_athlete_gt)
-        print(f"Copied: {athlete_gt_path.name} -> {dest_athlete_gt}")
+        copies.append((shutil.copy2, athlete_gt_path, dest_athlete_gt, f"Copied: {athlete_gt_path.name} -> {dest_athlete_gt}"))
 
     # Move results
     old_results_dir = PROJECT_ROOT / "results"
     if old_results_dir.exists():
         for result_file in old_results_dir.glob("*.json"):
             dest_result = results_dir / result_file.name
-            shutil.copy2(result_file, dest_result)
-            print(f"Copied result: {result_file.name}")
+            copies.append((shutil.copy2, result_file, dest_result, f"Copied result: {result_file.name}"))
+
+    # Copies are independent and I/O-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        futures = [executor.submit(copy, src, dst) for copy, src, dst, _ in copies]
+        for future, (*_, message) in zip(futures, copies):
+            future.result()
+            print(message)
 
     print("\nMigration complete!")
     print(f"\nNew structure:")
@@ -1,9 +1,15 @@
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared by the Gemini response models: instances are immutable once parsed,
+# unknown keys from the model output are dropped, and strings are trimmed
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", str_strip_whitespace=True)
 
 
 class AthleteDescription(BaseModel):
+    model_config = ConfigDict(**RESPONSE_MODEL_CONFIG, defer_build=True)
+
     scoreboard_side: Literal["left", "right"] = Field(description="Which side of scoreboard overlay")
     athlete_number: Literal["1", "2"] = Field(description="1 for left, 2 for right")
     name: str = Field(description="Name as shown on scoreboard")
@@ -13,6 +19,8 @@ class AthleteDescription(BaseModel):
 
 
 class AthleteIdentification(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     athlete_1: AthleteDescription = Field(description="Athlete on LEFT side of scoreboard")
     athlete_2: AthleteDescription = Field(description="Athlete on RIGHT side of scoreboard")
     same_gi_color: bool = Field(description="True if both athletes wear same color gi")
@@ -20,6 +28,8 @@ class AthleteIdentification(BaseModel):
 
 
 class ScoringEvent(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     timestamp_seconds: int = Field(description="Time in seconds from start of video when scoring change occurred")
     match_clock: str = Field(description="Time shown on match clock when event occurred (e.g. '8:45')")
     athlete: Literal["1", "2"] = Field(description="Which athlete scored: '1' for athlete on LEFT side of scoreboard, '2' for athlete on RIGHT side")
@@ -34,6 +44,8 @@ class ScoringEvent(BaseModel):
 
 
 class MatchAnalysis(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     athlete_1_name: str = Field(description="Full name of athlete 1 (LEFT side of scoreboard)")
     athlete_1_gi_color: str = Field(description="Gi color of athlete 1")
     athlete_2_name: str = Field(description="Full name of athlete 2 (RIGHT side of scoreboard)")
@@ -44,6 +56,8 @@ class MatchAnalysis(BaseModel):
 
 
 class AnalysisRun(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     model: str = Field(description="Gemini model used")
     media_resolution: str = Field(description="Media resolution setting")
     video_file: str = Field(description="Video file analyzed")
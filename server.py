@@ -1,17 +1,55 @@
-import json
+import mimetypes
+import os
 from pathlib import Path
+from urllib.parse import quote
 
-from flask import Flask, jsonify, request, send_from_directory
+import orjson
+from flask import Flask, Response, abort, request, send_from_directory
+from werkzeug.security import safe_join
+
+import match_index
+from storage import write_atomic
 
 app = Flask(__name__)
 
+# Behind Apache (mod_xsendfile) or lighttpd, let the web server send files
+app.config["USE_X_SENDFILE"] = os.getenv("USE_X_SENDFILE") == "1"
+
 MATCHES_DIR = Path("matches")
 
+# Browser cache lifetimes in seconds. Result files are written once and
+# metadata rarely changes; ground truth is edited in the UI, so it keeps the
+# default no-cache and is revalidated with its ETag on every request.
+METADATA_MAX_AGE = 60
+RESULT_MAX_AGE = 24 * 60 * 60
+
+# Behind nginx, videos are handed off via X-Accel-Redirect to an internal
+# location serving MATCHES_DIR, e.g. "/internal/matches/"
+X_ACCEL_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX")
+
 
 def get_match_dir(match_id: str) -> Path:
     return MATCHES_DIR / match_id
 
 
+def json_response(obj) -> Response:
+    """Serialize obj with orjson into a JSON response."""
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
+
+def read_json_body():
+    """Parse the request body as JSON, rejecting malformed input with a 400."""
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        abort(400, "Request body is not valid JSON")
+
+
+def write_json(path: Path, data):
+    """Atomically write data as indented JSON."""
+    write_atomic(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
 @app.route("/")
 def index():
     return send_from_directory(".", "index.html")
@@ -28,20 +66,7 @@ def editor():
 @app.route("/api/matches")
 def list_matches():
     """List all matches with basic info."""
-    matches = []
-    if MATCHES_DIR.exists():
-        for match_dir in sorted(MATCHES_DIR.iterdir()):
-            if match_dir.is_dir():
-                metadata_path = match_dir / "metadata.json"
-                if metadata_path.exists():
-                    with open(metadata_path) as f:
-                        metadata = json.load(f)
-                    matches.append({
-                        "video_id": metadata.get("video_id", match_dir.name),
-                        "title": metadata.get("title", match_dir.name),
-                        "thumbnail_url": metadata.get("thumbnail_url", ""),
-                    })
-    return jsonify(matches)
+    return json_response(match_index.list_matches())
 
 
 @app.route("/api/matches/<match_id>")
@@ -49,8 +74,8 @@ def get_match(match_id: str):
     """Get full metadata for a match."""
     metadata_path = get_match_dir(match_id) / "metadata.json"
     if metadata_path.exists():
-        return send_from_directory(get_match_dir(match_id), "metadata.json")
-    return jsonify({"error": "Match not found"}), 404
+        return send_from_directory(get_match_dir(match_id), "metadata.json", max_age=METADATA_MAX_AGE)
+    return json_response({"error": "Match not found"}), 404
 
 
 @app.route("/api/matches/<match_id>/results")
@@ -58,16 +83,20 @@ def list_match_results(match_id: str):
     """List results for a specific match."""
     results_dir = get_match_dir(match_id) / "results"
     if results_dir.exists():
-        files = sorted(results_dir.glob("*.json"), reverse=True)
-        return jsonify([f.name for f in files])
-    return jsonify([])
+        with os.scandir(results_dir) as it:
+            names = sorted(
+                (e.name for e in it if e.name.endswith(".json") and e.is_file()),
+                reverse=True,
+            )
+        return json_response(names)
+    return json_response([])
 
 
 @app.route("/api/matches/<match_id>/results/<filename>")
 def get_match_result(match_id: str, filename: str):
     """Get a specific result file for a match."""
     results_dir = get_match_dir(match_id) / "results"
-    return send_from_directory(results_dir, filename)
+    return send_from_directory(results_dir, filename, max_age=RESULT_MAX_AGE)
 
 
 @app.route("/api/matches/<match_id>/ground-truth", methods=["GET"])
@@ -76,7 +105,7 @@ def get_match_ground_truth(match_id: str):
     gt_path = get_match_dir(match_id) / "ground_truth.json"
     if gt_path.exists():
         return send_from_directory(get_match_dir(match_id), "ground_truth.json")
-    return jsonify(None)
+    return json_response(None)
 
 
 @app.route("/api/matches/<match_id>/ground-truth", methods=["POST"])
@@ -84,11 +113,10 @@ def save_match_ground_truth(match_id: str):
     """Save ground truth for a match."""
     match_dir = get_match_dir(match_id)
     match_dir.mkdir(parents=True, exist_ok=True)
-    data = request.get_json()
+    data = read_json_body()
     gt_path = match_dir / "ground_truth.json"
-    with open(gt_path, "w") as f:
-        json.dump(data, f, indent=2)
-    return jsonify({"status": "saved"})
+    write_json(gt_path, data)
+    return json_response({"status": "saved"})
 
 
 @app.route("/api/matches/<match_id>/athlete-id-ground-truth", methods=["GET"])
@@ -97,7 +125,7 @@ def get_match_athlete_id_gt(match_id: str):
     gt_path = get_match_dir(match_id) / "athlete_id_ground_truth.json"
     if gt_path.exists():
         return send_from_directory(get_match_dir(match_id), "athlete_id_ground_truth.json")
-    return jsonify(None)
+    return json_response(None)
 
 
 @app.route("/api/matches/<match_id>/athlete-id-ground-truth", methods=["POST"])
@@ -105,16 +133,24 @@ def save_match_athlete_id_gt(match_id: str):
     """Save athlete ID ground truth for a match."""
     match_dir = get_match_dir(match_id)
     match_dir.mkdir(parents=True, exist_ok=True)
-    data = request.get_json()
+    data = read_json_body()
     gt_path = match_dir / "athlete_id_ground_truth.json"
-    with open(gt_path, "w") as f:
-        json.dump(data, f, indent=2)
-    return jsonify({"status": "saved"})
+    write_json(gt_path, data)
+    return json_response({"status": "saved"})
 
 
 @app.route("/video/<match_id>/<filename>")
 def serve_match_video(match_id: str, filename: str):
     """Serve video file from match directory."""
+    if X_ACCEL_PREFIX:
+        # Let nginx stream the file; Python only validates the path
+        path = safe_join(str(MATCHES_DIR), match_id, filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        response = Response(mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream")
+        # nginx decodes the URI, so escape anything that is not a plain path character
+        response.headers["X-Accel-Redirect"] = f"{X_ACCEL_PREFIX.rstrip('/')}/{quote(match_id, safe='')}/{quote(filename, safe='')}"
+        return response
     return send_from_directory(get_match_dir(match_id), filename)
 
 
@@ -0,0 +1,26 @@
+"""
+File writes shared by the CLI and the web server.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Write data to path via a temp file in the same directory and a rename.
+
+    Readers see either the old file or the complete new one, never a partial
+    write. Each call gets its own temp file, and it is removed if the write fails.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates 0600; keep the file readable by a fronting web server
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
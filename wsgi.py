@@ -0,0 +1,13 @@
+"""
+WSGI entry point for running the server under a production WSGI server.
+
+Usage: uv run --with gunicorn gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:8000 wsgi:app
+
+Threaded workers keep listing and result requests responsive while other
+threads stream videos. Run from the project root so the relative matches/
+path resolves.
+"""
+
+from server import app
+
+__all__ = ["app"]